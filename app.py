@@ -1,8 +1,8 @@
 # app.py
 # -*- coding: utf-8 -*-
 
-import base64
 import streamlit as st
+from streamlit import runtime
 
 st.set_page_config(page_title="Talk2BIM – IFC Viewer", page_icon="🧩", layout="wide")
 st.title("Talk2BIM – IFC Viewer")
@@ -23,8 +23,20 @@ if not ifc_bytes:
     st.error("Die hochgeladene Datei ist leer.")
     st.stop()
 
-# Base64 als Transport in die HTML-Komponente
-ifc_b64 = base64.b64encode(ifc_bytes).decode("utf-8")
+# Rohbytes über den Media-Endpunkt von Streamlit ausliefern (kein Base64),
+# der Viewer lädt die Datei anschließend selbst per URL.
+# Achtung: nutzt den internen MediaFileManager von Streamlit (keine öffentliche
+# API) – bei Streamlit-Updates prüfen.
+if not runtime.exists():
+    st.error("Der Viewer benötigt eine laufende Streamlit-App (streamlit run app.py).")
+    st.stop()
+
+ifc_url = runtime.get_instance().media_file_mgr.add(
+    ifc_bytes, "application/octet-stream", "talk2bim.ifc_viewer"
+)
+# Relativ übergeben ("media/…"): Das srcdoc-iframe erbt die Basis-URL der
+# Streamlit-Seite, so greifen baseUrlPath und Proxy-Präfixe (z. B. /~/+/).
+ifc_url = ifc_url.lstrip("/")
 
 # KEIN f-string! Wir ersetzen nur einen Marker.
 html_template = """
@@ -134,18 +146,8 @@ html_template = """
       }
     }
 
-    // --- Base64 -> Blob URL
-    function base64ToUint8Array(base64) {
-      const raw = atob(base64);
-      const arr = new Uint8Array(raw.length);
-      for (let i = 0; i < raw.length; i++) arr[i] = raw.charCodeAt(i);
-      return arr;
-    }
-
-    const IFC_B64 = "__IFC_B64__";
-    const ifcBytes = base64ToUint8Array(IFC_B64);
-    const blob = new Blob([ifcBytes], { type: "application/octet-stream" });
-    const blobUrl = URL.createObjectURL(blob);
+    // --- IFC-Rohbytes kommen direkt vom Streamlit-Media-Endpunkt
+    const IFC_URL = "__IFC_URL__";
 
     // --- IFC Loader
     const ifcLoader = new IFCLoader();
@@ -154,7 +156,7 @@ html_template = """
     statusEl.textContent = "Lade IFC … (Parsing im Browser)";
 
     ifcLoader.load(
-      blobUrl,
+      IFC_URL,
       (model) => {
         scene.add(model);
 
@@ -176,7 +178,6 @@ html_template = """
         controls.update();
 
         statusEl.textContent = "IFC geladen.";
-        URL.revokeObjectURL(blobUrl);
       },
       (xhr) => {
         if (xhr && xhr.total) {
@@ -207,6 +208,6 @@ html_template = """
 </html>
 """
 
-html = html_template.replace("__IFC_B64__", ifc_b64)
+html = html_template.replace("__IFC_URL__", ifc_url)
 
 st.components.v1.html(html, height=850, scrolling=False)